@@ -0,0 +1,46 @@
+"""Common definitions for the service adapters."""
+
+from dcm_common import services
+
+
+class BaseAdapter(services.ServiceAdapter):
+    """
+    Common base for the `ServiceAdapter`s of this package.
+
+    Implementations need to define `_SERVICE_NAME` and `_SDK` (as
+    required by `ServiceAdapter`) as well as
+    _API -- name of the SDK's api-class providing the job-endpoints
+    _REQUEST_KEY -- key in the request body where the `target` is
+                    placed
+    """
+
+    _API: str
+    _REQUEST_KEY: str
+
+    @property
+    def url(self) -> str:
+        """Returns service url."""
+        return self._url
+
+    def _get_api_clients(self):
+        client = self._SDK.ApiClient(self._SDK.Configuration(host=self._url))
+        api = getattr(self._SDK, self._API)
+        return self._SDK.DefaultApi(client), api(client)
+
+    def _build_request_body(self, base_request_body, target):
+        if target is not None:
+            request = base_request_body.setdefault(self._REQUEST_KEY, {})
+            request["target"] = target
+        return base_request_body
+
+    def success(self, info) -> bool:
+        try:
+            return info.report["data"].get("success", False)
+        except KeyError:
+            return False
+
+    def valid(self, info) -> bool:
+        try:
+            return info.report["data"].get("valid", False)
+        except KeyError:
+            return False
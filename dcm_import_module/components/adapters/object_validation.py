@@ -1,22 +1,16 @@
 """Adapter-definition for object validation."""
 
-from dcm_common import services
 import dcm_object_validator_sdk
 
+from .common import BaseAdapter
 
-class ObjectValidationAdapter(services.ServiceAdapter):
+
+class ObjectValidationAdapter(BaseAdapter):
     """`ServiceAdapter` for the Object Validator service."""
     _SERVICE_NAME = "Object Validator"
     _SDK = dcm_object_validator_sdk
-
-    @property
-    def url(self) -> str:
-        """Returns service url."""
-        return self._url
-
-    def _get_api_clients(self):
-        client = self._SDK.ApiClient(self._SDK.Configuration(host=self._url))
-        return self._SDK.DefaultApi(client), self._SDK.ValidationApi(client)
+    _API = "ValidationApi"
+    _REQUEST_KEY = "validation"
 
     def _get_api_endpoint(self):
         return self._api_client.validate
@@ -25,16 +19,7 @@ class ObjectValidationAdapter(services.ServiceAdapter):
         return self._api_client.abort
 
     def _build_request_body(self, base_request_body, target):
-        if "validation" not in base_request_body:
-            base_request_body["validation"] = {}
-        if target is not None:
-            base_request_body["validation"]["target"] = target
-        if "plugins" not in base_request_body["validation"]:
-            base_request_body["validation"]["plugins"] = {}
-        return base_request_body
-
-    def success(self, info) -> bool:
-        return info.report.get("data", {}).get("success", False)
-
-    def valid(self, info) -> bool:
-        return info.report.get("data", {}).get("valid", False)
+        base_request_body.setdefault(self._REQUEST_KEY, {}).setdefault(
+            "plugins", {}
+        )
+        return super()._build_request_body(base_request_body, target)
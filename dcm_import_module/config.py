@@ -1,6 +1,11 @@
 """Configuration module for the 'DCM Import Module'-app."""
 
+from typing import Optional
 import os
+import json
+import hashlib
+import tempfile
+from functools import cache
 from pathlib import Path
 from importlib.metadata import version
 
@@ -12,6 +17,111 @@ from dcm_import_module.plugins import OAIPMHPlugin, OAIPMHPlugin2, DemoPlugin
 from dcm_import_module import util
 
 
+# prefer libyaml-based loader if available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _api_document_cache_path(path: Path, cache_dir: Path) -> Path:
+    """
+    Returns location of the JSON-cache for the OpenAPI-document at
+    `path` in `cache_dir`.
+    """
+    return cache_dir / (
+        path.stem
+        + "-"
+        + hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:16]
+        + ".json"
+    )
+
+
+def _is_trusted(stat: os.stat_result) -> bool:
+    """
+    Returns `True` if the file with `stat` is owned by the current user
+    and not writable by others.
+    """
+    return stat.st_uid == os.geteuid() and not stat.st_mode & 0o022
+
+
+@cache
+def _load_api_document(path: Path, cache_dir: Optional[Path] = None) -> dict:
+    """
+    Returns the parsed OpenAPI-document from the YAML-file at `path`.
+
+    If `cache_dir` is given, the parsed document is cached as JSON in
+    that directory (keyed by the modification time of the YAML-file).
+    On subsequent calls, this cache is used instead of parsing the
+    YAML-file again. A cache that can not be read or that is not owned
+    by the current user is ignored; if `cache_dir` is not writable, no
+    cache is generated.
+    """
+    with path.open("rb") as stream:
+        mtime_ns = os.fstat(stream.fileno()).st_mtime_ns
+        if cache_dir is None:
+            return yaml.load(stream, Loader=_YAML_LOADER)
+        cache_path = _api_document_cache_path(path, cache_dir)
+
+        # try to load from cache
+        try:
+            with cache_path.open("rb") as cache_stream:
+                if _is_trusted(os.fstat(cache_stream.fileno())):
+                    cached = json.load(cache_stream)
+                    if cached["_mtime_ns"] == mtime_ns:
+                        return cached["doc"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        # parse yaml
+        doc = yaml.load(stream, Loader=_YAML_LOADER)
+
+    # (re-)write cache
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return doc
+    if not os.access(cache_dir, os.W_OK | os.X_OK):
+        return doc
+    try:
+        serialized = json.dumps({"_mtime_ns": mtime_ns, "doc": doc})
+    except (TypeError, ValueError):
+        return doc
+    # only cache documents that survive a JSON-roundtrip unchanged
+    # (e.g., integer-keys are converted into strings)
+    if json.loads(serialized)["doc"] != doc:
+        return doc
+    try:
+        fd, tmp_path = tempfile.mkstemp(
+            suffix=".tmp", prefix=cache_path.stem + ".", dir=cache_dir
+        )
+    except OSError:
+        return doc
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_stream:
+            tmp_stream.write(serialized)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        Path(tmp_path).unlink(missing_ok=True)
+    return doc
+
+
+@cache
+def _app_version() -> str:
+    """Returns the installed version of this package."""
+    return version("dcm-import-module")
+
+
+class _APIDocument:
+    """
+    Descriptor that provides the parsed OpenAPI-document referenced by
+    the owner's `API_DOCUMENT`. The document is only loaded on first
+    access.
+    """
+
+    def __get__(self, instance, owner) -> dict:
+        return _load_api_document(
+            owner.API_DOCUMENT, owner.API_DOCUMENT_CACHE_DIR
+        )
+
+
 class AppConfig(FSConfig, OrchestratedAppConfig):
     """Configuration for the 'Import Module'-app."""
 
@@ -20,10 +130,27 @@ class AppConfig(FSConfig, OrchestratedAppConfig):
         float(os.environ.get("SOURCE_SYSTEM_TIMEOUT") or 30)
     SOURCE_SYSTEM_TIMEOUT_RETRIES = \
         int(os.environ.get("SOURCE_SYSTEM_TIMEOUT_RETRIES") or 3)
-    SOURCE_SYSTEM_TIMEOUT_RETRY_INTERVAL = \
-        int(os.environ.get("SOURCE_SYSTEM_TIMEOUT_RETRY_INTERVAL") or 360)
+    # exponential backoff between retries of requests to a source system
+    # (SOURCE_SYSTEM_TIMEOUT_RETRY_INTERVAL is a deprecated alias)
+    SOURCE_SYSTEM_RETRY_BASE_DELAY = float(
+        os.environ.get("SOURCE_SYSTEM_RETRY_BASE_DELAY")
+        or os.environ.get("SOURCE_SYSTEM_TIMEOUT_RETRY_INTERVAL")
+        or 1
+    )
+    SOURCE_SYSTEM_RETRY_MAX_DELAY = \
+        float(os.environ.get("SOURCE_SYSTEM_RETRY_MAX_DELAY") or 30)
+    SOURCE_SYSTEM_RETRY_JITTER = \
+        float(os.environ.get("SOURCE_SYSTEM_RETRY_JITTER") or 0.5)
+    # max. number of records that are fetched concurrently during an import
+    SOURCE_SYSTEM_CONCURRENCY = \
+        int(os.environ.get("SOURCE_SYSTEM_CONCURRENCY") or 1)
+    # min. duration between two record-requests to a source system (shared
+    # between all jobs)
+    SOURCE_SYSTEM_REQUEST_INTERVAL = (
+        float(os.environ.get("SOURCE_SYSTEM_REQUEST_INTERVAL") or 0) or None
+    )
     # determine if test-plugin should available
-    USE_DEMO_PLUGIN = (int(os.environ.get("USE_DEMO_PLUGIN") or 0)) == 1
+    USE_DEMO_PLUGIN = os.environ.get("USE_DEMO_PLUGIN", "0") == "1"
     # output directory for ie- and ip-import (relative to FS_MOUNT_POINT)
     IE_OUTPUT = Path(os.environ.get("IE_OUTPUT") or "ie/")
     IP_OUTPUT = Path(os.environ.get("IP_OUTPUT") or "ip/")
@@ -36,9 +163,7 @@ class AppConfig(FSConfig, OrchestratedAppConfig):
     )
     # OAI-plugins
     OAI_MAX_RESUMPTION_TOKENS = (
-        int(os.environ["OAI_MAX_RESUMPTION_TOKENS"])
-        if "OAI_MAX_RESUMPTION_TOKENS" in os.environ
-        else None
+        int(os.environ.get("OAI_MAX_RESUMPTION_TOKENS") or 0) or None
     )
     # hotfolders
     HOTFOLDER_SRC = os.environ.get("HOTFOLDER_SRC", "[]")
@@ -55,10 +180,14 @@ class AppConfig(FSConfig, OrchestratedAppConfig):
 
     # ------ API ------
     API_DOCUMENT = Path(dcm_import_module_api.__file__).parent / "openapi.yaml"
-    API = yaml.load(
-        API_DOCUMENT.read_text(encoding="utf-8"),
-        Loader=yaml.SafeLoader
+    # writable directory for caching the parsed API-document (disabled
+    # if not set)
+    API_DOCUMENT_CACHE_DIR = (
+        Path(os.environ["API_DOCUMENT_CACHE_DIR"])
+        if os.environ.get("API_DOCUMENT_CACHE_DIR")
+        else None
     )
+    API = _APIDocument()
 
     def __init__(self, **kwargs) -> None:
         # load plugins
@@ -68,10 +197,19 @@ class AppConfig(FSConfig, OrchestratedAppConfig):
                 self.IE_OUTPUT,
                 timeout=self.SOURCE_SYSTEM_TIMEOUT,
                 max_retries=self.SOURCE_SYSTEM_TIMEOUT_RETRIES,
+                retry_base_delay=self.SOURCE_SYSTEM_RETRY_BASE_DELAY,
+                retry_max_delay=self.SOURCE_SYSTEM_RETRY_MAX_DELAY,
+                retry_jitter=self.SOURCE_SYSTEM_RETRY_JITTER,
                 max_resumption_tokens=self.OAI_MAX_RESUMPTION_TOKENS,
                 test_strategy=self.IMPORT_TEST_STRATEGY,
                 test_volume=self.IMPORT_TEST_VOLUME,
+                concurrency=self.SOURCE_SYSTEM_CONCURRENCY,
+                request_interval=self.SOURCE_SYSTEM_REQUEST_INTERVAL,
             )
+        self._plugins_descriptor = {
+            name: plugin.json
+            for name, plugin in self.supported_plugins.items()
+        }
 
         # load hotfolders
         if (hotfolder_src := Path(self.HOTFOLDER_SRC)).is_file():
@@ -96,9 +234,7 @@ class AppConfig(FSConfig, OrchestratedAppConfig):
         self.CONTAINER_SELF_DESCRIPTION["version"]["api"] = (
             self.API["info"]["version"]
         )
-        self.CONTAINER_SELF_DESCRIPTION["version"]["app"] = version(
-            "dcm-import-module"
-        )
+        self.CONTAINER_SELF_DESCRIPTION["version"]["app"] = _app_version()
 
         # configuration
         # - settings
@@ -108,8 +244,14 @@ class AppConfig(FSConfig, OrchestratedAppConfig):
             "timeout": {
                 "duration": int(self.SOURCE_SYSTEM_TIMEOUT),
                 "max_retries": self.SOURCE_SYSTEM_TIMEOUT_RETRIES,
-                "retry_interval": self.SOURCE_SYSTEM_TIMEOUT_RETRY_INTERVAL
+                "retry_base_delay": self.SOURCE_SYSTEM_RETRY_BASE_DELAY,
+                "retry_max_delay": self.SOURCE_SYSTEM_RETRY_MAX_DELAY,
+                "retry_jitter": self.SOURCE_SYSTEM_RETRY_JITTER,
+                # deprecated
+                "retry_interval": self.SOURCE_SYSTEM_RETRY_BASE_DELAY,
             },
+            "concurrency": self.SOURCE_SYSTEM_CONCURRENCY,
+            "request_interval": self.SOURCE_SYSTEM_REQUEST_INTERVAL,
             "test": {
                 "volume": self.IMPORT_TEST_VOLUME,
                 "strategy": self.IMPORT_TEST_STRATEGY,
@@ -121,10 +263,9 @@ class AppConfig(FSConfig, OrchestratedAppConfig):
             }
         }
         # - plugins
-        self.CONTAINER_SELF_DESCRIPTION["configuration"]["plugins"] = {
-            plugin.name: plugin.json
-            for plugin in self.supported_plugins.values()
-        }
+        self.CONTAINER_SELF_DESCRIPTION["configuration"]["plugins"] = (
+            self._plugins_descriptor
+        )
         # - services
         self.CONTAINER_SELF_DESCRIPTION["configuration"]["services"] = {
             "ip_builder": self.IP_BUILDER_HOST,
@@ -10,6 +10,12 @@ from dcm_import_module.plugins import IEImportPlugin
 from dcm_import_module.models.import_config import Target, ImportConfigIPs
 
 
+# stateless validators shared by the handlers below
+_FREE_FORM = Object(free_form=True)
+_TOKEN = UUID()
+_CALLBACK_URL = Url(schemes=["http", "https"])
+
+
 report_handler = Object(
     properties={Property("token", required=True): String()},
     accept_only=["token"],
@@ -28,14 +34,10 @@ def get_ies_import_handler(acceptable_plugins: Mapping[str, IEImportPlugin]):
                 acceptable_plugins,
                 acceptable_context=["import"],
             ),
-            Property("objectValidation", name="obj_validation"): Object(
-                free_form=True
-            ),
-            Property("build"): Object(free_form=True),
-            Property("token"): UUID(),
-            Property("callbackUrl", name="callback_url"): Url(
-                schemes=["http", "https"]
-            ),
+            Property("objectValidation", name="obj_validation"): _FREE_FORM,
+            Property("build"): _FREE_FORM,
+            Property("token"): _TOKEN,
+            Property("callbackUrl", name="callback_url"): _CALLBACK_URL,
         },
         accept_only=[
             "import",
@@ -69,16 +71,12 @@ ips_import_handler = Object(
                 "test",
             ],
         ),
-        Property("specificationValidation", name="spec_validation"): Object(
-            free_form=True
-        ),
-        Property("objectValidation", name="obj_validation"): Object(
-            free_form=True
-        ),
-        Property("token"): UUID(),
-        Property("callbackUrl", name="callback_url"): Url(
-            schemes=["http", "https"]
-        ),
+        Property(
+            "specificationValidation", name="spec_validation"
+        ): _FREE_FORM,
+        Property("objectValidation", name="obj_validation"): _FREE_FORM,
+        Property("token"): _TOKEN,
+        Property("callbackUrl", name="callback_url"): _CALLBACK_URL,
     },
     accept_only=[
         "import",
@@ -3,13 +3,19 @@
 from typing import Optional
 from datetime import datetime
 from uuid import uuid4
+from itertools import product
 import random
 
 from dcm_common.logger import LoggingContext
 from dcm_common.plugins import Signature, Argument, JSONType
 
 from dcm_import_module.models import IE
-from .interface import IEImportPlugin, IEImportResult, IEImportContext
+from .interface import (
+    IEImportPlugin,
+    IEImportResult,
+    IEImportContext,
+    ThrottledPush,
+)
 
 
 class DemoPlugin(IEImportPlugin):
@@ -75,6 +81,18 @@ class DemoPlugin(IEImportPlugin):
     </record>
   </GetRecord>
 </OAI-PMH>"""
+    # format-string-version of _TEMPLATE (placeholders become named fields)
+    _TEMPLATE_FMT = (
+        _TEMPLATE.replace("{", "{{")
+        .replace("}", "}}")
+        .replace("RESPONSE_DATETIME", "{response_datetime}")
+        .replace("DATE", "{date}")
+        .replace("IDENTIFIER", "{identifier}")
+        .replace("CREATOR", "{creator}")
+        .replace("SUBJECT", "{subject}")
+        .replace("INSTITUTION", "{institution}")
+        .replace("TITLE", "{title}")
+    )
     _FIRSTNAMES = ["Bartholomew", "Priscilla", "Nigel", "Percival", "Tabatha"]
     _SURNAMES = [
         "Featherstonehaugh",
@@ -119,61 +137,84 @@ class DemoPlugin(IEImportPlugin):
         "Genome",
         "Language",
     ]
+    # all title variants (keeps the distribution of independently drawn
+    # template and words)
+    _RENDERED_TITLES = tuple(
+        t.format(w1, w2) for t, w1, w2 in product(_TITLES, _WORDS, _WORDS)
+    )
+    # _TEMPLATE_FMT with static (non-randomized) values already inserted
+    _TEMPLATE_FMT_STATIC = (
+        _TEMPLATE_FMT.replace(
+            "{creator}", _SURNAMES[0] + ", " + _FIRSTNAMES[0]
+        )
+        .replace("{subject}", _SUBJECTS[0])
+        .replace("{institution}", _INSTITUTIONS[0])
+        .replace("{title}", _TITLES[0].format(_WORDS[0], _WORDS[1]))
+    )
 
     @classmethod
     def generate_metadata(
-        cls, randomize: bool = False, identifier: Optional[str] = None
+        cls,
+        randomize: bool = False,
+        identifier: Optional[str] = None,
+        response_datetime: Optional[str] = None,
+        date: Optional[str] = None,
     ) -> str:
-        """Generate fake metadata based on template."""
-        creator = (
-            (
+        """
+        Generate fake metadata based on template.
+
+        Keyword arguments:
+        randomize -- whether to randomize the metadata
+                     (default False)
+        identifier -- record identifier
+                      (default None; generates a random identifier)
+        response_datetime -- ISO-formatted response datetime
+                             (default None; uses current time)
+        date -- record date as 'YYYY-MM-DD'
+                (default None; uses current date)
+        """
+        if response_datetime is None or date is None:
+            now = datetime.now()
+            response_datetime = response_datetime or now.isoformat()
+            date = date or now.strftime("%Y-%m-%d")
+        identifier = identifier or "test:oai_dc:" + str(uuid4())
+        if not randomize:
+            return cls._TEMPLATE_FMT_STATIC.format(
+                response_datetime=response_datetime,
+                date=date,
+                identifier=identifier,
+            )
+        return cls._TEMPLATE_FMT.format(
+            response_datetime=response_datetime,
+            date=date,
+            identifier=identifier,
+            creator=(
                 random.choice(cls._SURNAMES)
                 + ", "
                 + random.choice(cls._FIRSTNAMES)
-            )
-            if randomize
-            else (cls._SURNAMES[0] + ", " + cls._FIRSTNAMES[0])
-        )
-        subject = (
-            random.choice(cls._SUBJECTS) if randomize else cls._SUBJECTS[0]
-        )
-        institution = (
-            random.choice(cls._INSTITUTIONS)
-            if randomize
-            else cls._INSTITUTIONS[0]
-        )
-        _title = random.choice(cls._TITLES) if randomize else cls._TITLES[0]
-        title = (
-            _title.format(random.choice(cls._WORDS), random.choice(cls._WORDS))
-            if randomize
-            else _title.format(cls._WORDS[0], cls._WORDS[1])
-        )
-        return (
-            cls._TEMPLATE.replace(
-                "RESPONSE_DATETIME", datetime.now().isoformat()
-            )
-            .replace("DATE", datetime.now().strftime("%Y-%m-%d"))
-            .replace("IDENTIFIER", identifier or "test:oai_dc:" + str(uuid4()))
-            .replace("CREATOR", creator)
-            .replace("SUBJECT", subject)
-            .replace("INSTITUTION", institution)
-            .replace("TITLE", title)
+            ),
+            subject=random.choice(cls._SUBJECTS),
+            institution=random.choice(cls._INSTITUTIONS),
+            title=random.choice(cls._RENDERED_TITLES),
         )
 
     def _generate_ie(
-        self, identifier: str, fetched_payload: bool, kwargs
+        self,
+        identifier: str,
+        fetched_payload: bool,
+        randomize: bool,
+        response_datetime: str,
+        date: str,
+        payload_content: bytes,
     ) -> IE:
         """Generates and returns IE."""
-        ie_path = self._get_ie_output()
-        (ie_path / "meta").mkdir()
-        (ie_path / "meta" / "source_metadata.xml").write_text(
-            self.generate_metadata(kwargs["randomize"], identifier),
-            encoding="utf-8",
-        )
-        (ie_path / "data" / "preservation_master").mkdir(parents=True)
-        (ie_path / "data" / "preservation_master" / "payload.txt").write_text(
-            "called with: " + str(kwargs), encoding="utf-8"
+        ie_path, meta, payload = self._get_ie_output_dirs()
+        (meta / "source_metadata.xml").write_bytes(
+            self.generate_metadata(
+                randomize, identifier, response_datetime, date
+            ).encode("utf-8")
         )
+        (payload / "payload.txt").write_bytes(payload_content)
         return IE(
             path=ie_path,
             source_identifier=identifier,
@@ -187,29 +228,43 @@ class DemoPlugin(IEImportPlugin):
         context.push()
 
         # iterate
+        now = datetime.now()
+        response_datetime = now.isoformat()
+        date = now.strftime("%Y-%m-%d")
+        payload_content = ("called with: " + str(kwargs)).encode("utf-8")
         nidentifiers = kwargs["number"]
-        for idx, _ in enumerate(range(nidentifiers)):
+        width = len(str(nidentifiers))
+        randomize = kwargs["randomize"]
+        bad_ies = kwargs["bad_ies"]
+        push = ThrottledPush(context.push, self._PROGRESS_PUSH_INTERVAL)
+        for idx in range(nidentifiers):
             identifier = "test:oai_dc:" + str(uuid4())
-            ie_id = "ie" + str(idx).zfill(len(str(nidentifiers)))
+            ie_id = "ie" + str(idx).zfill(width)
 
             context.set_progress(f"generating record '{identifier}' ({ie_id})")
-            context.push()
+            push()
 
-            context.result.ies[ie_id] = self._generate_ie(
-                identifier, idx % 2 == 0 if kwargs["bad_ies"] else True, kwargs
+            ie = self._generate_ie(
+                identifier,
+                idx % 2 == 0 if bad_ies else True,
+                randomize,
+                response_datetime,
+                date,
+                payload_content,
             )
+            context.result.ies[ie_id] = ie
             context.result.log.log(
                 LoggingContext.INFO,
-                body=f"Created IE in '{context.result.ies[ie_id].path}'.",
+                body=f"Created IE in '{ie.path}'.",
                 origin=self._NAME,
             )
-            if not context.result.ies[ie_id].fetched_payload:
+            if not ie.fetched_payload:
                 context.result.log.log(
                     LoggingContext.ERROR,
                     body=f"Missing payload in IE '{ie_id}'.",
                     origin=self._NAME,
                 )
-            context.push()
+            push()
 
         # eval
         context.result.success = all(
@@ -4,6 +4,10 @@ from typing import Optional, Any, Callable, Mapping
 from dataclasses import dataclass, field
 import abc
 from pathlib import Path
+from random import uniform
+from time import monotonic, sleep
+from threading import Lock
+from functools import wraps
 
 from dcm_common import LoggingContext, Logger
 from dcm_common.plugins import (
@@ -39,6 +43,87 @@ class IEImportContext(PluginExecutionContext):
     result: IEImportResult = field(default_factory=IEImportResult)
 
 
+class ThrottledPush:
+    """
+    Callable wrapper for a push-function (like
+    `PluginExecutionContext.push`) that forwards calls at most once per
+    `interval` seconds. The first call is always forwarded.
+
+    Keyword arguments:
+    push -- push-function
+    interval -- minimum duration between two forwarded calls in seconds
+    """
+
+    def __init__(self, push: Callable[[], Any], interval: float) -> None:
+        self._push = push
+        self._interval = interval
+        self._last: Optional[float] = None
+
+    def __call__(self, force: bool = False) -> bool:
+        """
+        Forward call if `force` is set or `interval` has passed since
+        the last forwarded call. Returns `True` if forwarded.
+        """
+        now = monotonic()
+        if (
+            not force
+            and self._last is not None
+            and now - self._last < self._interval
+        ):
+            return False
+        self._last = now
+        self._push()
+        return True
+
+
+class RateLimiter:
+    """
+    Thread-safe rate-limiter that enforces a minimum duration of
+    `interval` seconds between the starts of two calls.
+
+    Keyword arguments:
+    interval -- minimum duration between two calls in seconds
+    """
+
+    _shared: dict[tuple[str, float], "RateLimiter"] = {}
+    _shared_lock = Lock()
+
+    def __init__(self, interval: float) -> None:
+        self._interval = interval
+        self._lock = Lock()
+        self._next = 0.0
+
+    @classmethod
+    def shared(cls, key: str, interval: float) -> "RateLimiter":
+        """
+        Returns a `RateLimiter` with `interval` that is shared between
+        all callers using the same `key` (e.g., a source system).
+        """
+        with cls._shared_lock:
+            if (key, interval) not in cls._shared:
+                cls._shared[(key, interval)] = cls(interval)
+            return cls._shared[(key, interval)]
+
+    def wait(self) -> None:
+        """Block until the next call is allowed."""
+        with self._lock:
+            now = monotonic()
+            slot = max(now, self._next)
+            self._next = slot + self._interval
+        if slot > now:
+            sleep(slot - now)
+
+    def limit(self, cmd: Callable[..., Any]) -> Callable[..., Any]:
+        """Returns wrapped `cmd` that calls `wait` before every call."""
+
+        @wraps(cmd)
+        def limited(*args, **kwargs):
+            self.wait()
+            return cmd(*args, **kwargs)
+
+        return limited
+
+
 class IEImportPlugin(PluginInterface, metaclass=abc.ABCMeta):
     """
     External IE-import plugin-base class.
@@ -62,6 +147,23 @@ class IEImportPlugin(PluginInterface, metaclass=abc.ABCMeta):
     test_volume -- max. number of identifiers considered during a
                    test-import
                    (default 2)
+    retry_base_delay -- delay before the first retry in seconds; doubled
+                        for every subsequent retry
+                        (default 1.0)
+    retry_max_delay -- upper bound for the delay between retries in
+                       seconds (including jitter)
+                       (default 30.0)
+    retry_jitter -- relative amount of uniform random jitter applied to
+                    retry delays (e.g., 0.5 for +-50%)
+                    (default 0.5)
+    concurrency -- max. number of records that are processed
+                   concurrently (if supported by the plugin)
+                   (default 1)
+    request_interval -- minimum duration between two record-requests
+                        to the same source system in seconds (shared
+                        between all jobs; if supported by the plugin);
+                        only considered when positive
+                        (default None leads to no restriction)
     """
 
     _CONTEXT = "import"
@@ -75,6 +177,8 @@ class IEImportPlugin(PluginInterface, metaclass=abc.ABCMeta):
         ),
     )
     _RESULT_TYPE = IEImportResult
+    # minimum duration between progress-pushes for individual records
+    _PROGRESS_PUSH_INTERVAL = 0.1
 
     def __init__(
         self,
@@ -84,6 +188,11 @@ class IEImportPlugin(PluginInterface, metaclass=abc.ABCMeta):
         max_resumption_tokens: Optional[int] = None,
         test_strategy: Optional[str] = None,
         test_volume: int = 2,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
+        retry_jitter: float = 0.5,
+        concurrency: int = 1,
+        request_interval: Optional[float] = None,
         **kwargs,
     ) -> None:
         super().__init__()
@@ -106,6 +215,30 @@ class IEImportPlugin(PluginInterface, metaclass=abc.ABCMeta):
                 + f"Value should be >= 1 (got {test_volume}) ."
             )
         self._test_volume = test_volume
+        for name, value in (
+            ("retry_base_delay", retry_base_delay),
+            ("retry_max_delay", retry_max_delay),
+        ):
+            if value < 0:
+                raise ValueError(
+                    f"Bad {name} configuration in plugin '{self._NAME}': "
+                    + f"Value should be >= 0 (got {value})."
+                )
+        if not 0 <= retry_jitter <= 1:
+            raise ValueError(
+                f"Bad retry_jitter configuration in plugin '{self._NAME}': "
+                + f"Value should be between 0 and 1 (got {retry_jitter})."
+            )
+        self._retry_base_delay = retry_base_delay
+        self._retry_max_delay = retry_max_delay
+        self._retry_jitter = retry_jitter
+        if concurrency <= 0:
+            raise ValueError(
+                f"Bad concurrency configuration in plugin '{self._NAME}': "
+                + f"Value should be >= 1 (got {concurrency})."
+            )
+        self._concurrency = concurrency
+        self._request_interval = request_interval
 
     def _get_ie_output(self) -> Optional[Path]:
         """
@@ -115,6 +248,38 @@ class IEImportPlugin(PluginInterface, metaclass=abc.ABCMeta):
         """
         return get_output_path(self._working_dir)
 
+    def _get_ie_output_dirs(self) -> tuple[Path, Path, Path]:
+        """
+        Generates a new IE-directory (see `_get_ie_output`) including
+        its subdirectories 'meta' and 'data/preservation_master'.
+        Returns a tuple of the IE-, meta-, and payload-directory.
+        """
+        ie_path = self._get_ie_output()
+        meta = ie_path / "meta"
+        payload = ie_path / "data" / "preservation_master"
+        # explicit mkdir-calls avoid the failing first attempt of
+        # `mkdir(parents=True)` for a freshly created `ie_path`
+        meta.mkdir()
+        payload.parent.mkdir()
+        payload.mkdir()
+        return ie_path, meta, payload
+
+    def _get_retry_delay(self, retry: int) -> float:
+        """
+        Returns delay in seconds before attempt `retry + 1` (exponential
+        backoff with jitter, capped by `self._retry_max_delay`).
+        """
+        # clamp exponent to prevent an OverflowError for large `retry`
+        return max(
+            0.0,
+            min(
+                self._retry_max_delay,
+                self._retry_base_delay
+                * 2 ** min(retry, 62)
+                * (1 + uniform(-self._retry_jitter, self._retry_jitter)),
+            ),
+        )
+
     def _retry(
         self,
         cmd: Callable[[], Any],
@@ -122,34 +287,70 @@ class IEImportPlugin(PluginInterface, metaclass=abc.ABCMeta):
         kwargs: Optional[Mapping[str, Any]] = None,
         description: Optional[str] = None,
         exceptions: type[Exception] | tuple[type[Exception]] = TimeoutError,
+        fatal_exceptions: type[Exception] | tuple[type[Exception]] = (),
+        retry_if: Optional[Callable[[Exception], bool]] = None,
     ) -> tuple[Logger, Optional[Any]]:
         """
         Execute `cmd` up to `self._max_retries` times and return
-        results if successful.
+        results if successful. Retries are delayed by a capped
+        exponential backoff with jitter. Failed attempts are logged as
+        errors or, if a later attempt succeeds, as warnings.
 
         Keyword arguments:
         cmd -- callable that should be executed
         description -- task description used in generated `Logger`
                        (default None)
-        exceptions -- tuple of exceptions identified as timeout
+        exceptions -- tuple of exceptions identified as timeout (or
+                      other transient errors); these are retried
                       (default TimeoutError)
+        fatal_exceptions -- tuple of exceptions identified as
+                            deterministic errors; these are logged but
+                            not retried
+                            (default ())
+        retry_if -- predicate for exceptions from `exceptions`; if it
+                    returns `False`, the exception is handled like
+                    `fatal_exceptions`
+                    (default None)
         """
 
+        def error_message(exc_info: Exception, retry: int) -> str:
+            return (
+                f"Encountered '{type(exc_info).__name__}'"
+                + (f" while '{description}'" if description else "")
+                + f". (Attempt {retry + 1}/{self._max_retries + 1})"
+            )
+
         result = None
-        log = Logger(default_origin=self._DISPLAY_NAME)
+        success = False
+        messages = []
         retry = 0
         while 0 <= retry <= self._max_retries:
             try:
                 result = cmd(*(args or ()), **(kwargs or {}))
+                success = True
                 break
             except exceptions as exc_info:
-                log.log(
-                    LoggingContext.ERROR,
-                    body=f"Encountered '{type(exc_info).__name__}'"
-                    + (f" while '{description}'" if description else "")
-                    + f". (Attempt {retry + 1}/{self._max_retries + 1})",
-                )
+                if retry_if is not None and not retry_if(exc_info):
+                    messages.append(
+                        error_message(exc_info, retry) + " Not retrying."
+                    )
+                    break
+                messages.append(error_message(exc_info, retry))
+                if retry < self._max_retries:
+                    sleep(self._get_retry_delay(retry))
                 retry += 1
+            except fatal_exceptions as exc_info:
+                messages.append(
+                    error_message(exc_info, retry) + " Not retrying."
+                )
+                break
+
+        log = Logger(default_origin=self._DISPLAY_NAME)
+        for message in messages:
+            log.log(
+                LoggingContext.WARNING if success else LoggingContext.ERROR,
+                body=message,
+            )
         return log, result
 
     @abc.abstractmethod
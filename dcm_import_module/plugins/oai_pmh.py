@@ -1,7 +1,9 @@
 """OAI-protocol based IE-import plugin."""
 
-from typing import Optional, Mapping
+from typing import Optional, Mapping, Callable
 from random import sample
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock, local as thread_local
 
 import requests
 from dcm_common.logger import LoggingContext, Logger
@@ -14,7 +16,13 @@ from oai_pmh_extractor import (
 )
 
 from dcm_import_module.models import IE
-from .interface import IEImportPlugin, IEImportResult, IEImportContext
+from .interface import (
+    IEImportPlugin,
+    IEImportResult,
+    IEImportContext,
+    ThrottledPush,
+    RateLimiter,
+)
 
 
 class OAIPMHPlugin(IEImportPlugin):
@@ -34,6 +42,17 @@ class OAIPMHPlugin(IEImportPlugin):
         PythonDependency("oai-pmh-extractor"),
         PythonDependency("requests"),
     ]
+    # exceptions raised by requests to the source system that are
+    # retried; HTTP errors are only retried if transient (see
+    # `_is_transient`)
+    _TRANSIENT_EXCEPTIONS = (
+        requests.exceptions.ReadTimeout,
+        requests.exceptions.ConnectionError,
+        requests.exceptions.HTTPError,
+    )
+    # status codes of transient HTTP errors (in addition to 5xx)
+    _TRANSIENT_STATUS_CODES = (429,)
+    _URL_SCHEMES = ("http", "https")
 
     _SIGNATURE = Signature(
         test=IEImportPlugin.signature.properties["test"],
@@ -120,11 +139,11 @@ class OAIPMHPlugin(IEImportPlugin):
 
     @classmethod
     def _validate_more(cls, kwargs):
-        schemes = ["http", "https"]
-        if not any(
-            kwargs["base_url"].startswith(scheme) for scheme in schemes
-        ):
-            return False, f"Bad url-scheme, supported are {qjoin(schemes)}"
+        if not kwargs["base_url"].startswith(cls._URL_SCHEMES):
+            return (
+                False,
+                f"Bad url-scheme, supported are {qjoin(cls._URL_SCHEMES)}",
+            )
         return True, ""
 
     def _get_collector(self, transfer_url_info: Mapping) -> PayloadCollector:
@@ -152,7 +171,115 @@ class OAIPMHPlugin(IEImportPlugin):
             interface.list_identifiers_exhaustive,
             kwargs=request_args,
             description="collecting identifiers",
-            exceptions=(requests.exceptions.ReadTimeout, OverflowError),
+            exceptions=self._TRANSIENT_EXCEPTIONS,
+            fatal_exceptions=(OverflowError,),
+            retry_if=self._is_transient,
+        )
+
+    @classmethod
+    def _is_transient(cls, exc_info: Exception) -> bool:
+        """
+        Returns `True` if `exc_info` should be retried. HTTP errors are
+        only retried for server errors (5xx) and rate limiting (429);
+        other (client) errors are deterministic.
+        """
+        if isinstance(exc_info, requests.exceptions.HTTPError):
+            if exc_info.response is None:
+                return False
+            return (
+                exc_info.response.status_code >= 500
+                or exc_info.response.status_code
+                in cls._TRANSIENT_STATUS_CODES
+            )
+        return True
+
+    def _get_interface(self, base_url: str) -> RepositoryInterface:
+        interface = RepositoryInterface(base_url, self._timeout)
+        interface.preserve_log = True
+        return interface
+
+    def _get_limiter(self, base_url: str) -> Optional[RateLimiter]:
+        """
+        Returns the `RateLimiter` for record-requests to the source
+        system at `base_url` that is shared between all jobs (`None` if
+        requests are not limited).
+        """
+        if self._request_interval is None or self._request_interval <= 0:
+            return None
+        return RateLimiter.shared(base_url, self._request_interval)
+
+    def _get_record(
+        self,
+        interface: RepositoryInterface,
+        collector: PayloadCollector,
+        metadata_prefix: str,
+        identifier: str,
+        report: Callable[[LoggingContext, str], None],
+        limiter: Optional[RateLimiter] = None,
+    ) -> tuple[Logger, Optional[IE]]:
+        """
+        Downloads record metadata and payload for a single `identifier`.
+        Returns a `Logger` and the generated `IE` (`None` if not
+        successful). `report` is called with messages that belong into
+        the result's log (empty or deleted records). If given, every
+        request (including retries) is subject to `limiter`.
+        """
+
+        # collect record
+        log, record = self._retry(
+            (
+                interface.get_record
+                if limiter is None
+                else limiter.limit(interface.get_record)
+            ),
+            kwargs={
+                "metadata_prefix": metadata_prefix,
+                "identifier": identifier,
+            },
+            description=f"fetching metadata of record {identifier}",
+            exceptions=self._TRANSIENT_EXCEPTIONS,
+            retry_if=self._is_transient,
+        )
+        if LoggingContext.ERROR in log:
+            return log, None
+
+        # process
+        if record is None:
+            report(LoggingContext.ERROR, f"Got empty record '{identifier}'.")
+            return log, None
+        if record.status == "deleted":
+            report(
+                LoggingContext.WARNING,
+                f"Record '{identifier}' has been marked 'deleted'.",
+            )
+            return log, None
+        ie_path, meta, payload = self._get_ie_output_dirs()
+        (meta / "source_metadata.xml").write_bytes(
+            record.metadata_raw.encode("utf-8")
+        )
+
+        # fetching payload
+        payload_log, _ = self._retry(
+            (
+                collector.download_record_payload
+                if limiter is None
+                else limiter.limit(collector.download_record_payload)
+            ),
+            args=(record, payload),
+            description=f"fetching payload of record {identifier}",
+            exceptions=self._TRANSIENT_EXCEPTIONS,
+            retry_if=self._is_transient,
+        )
+        log.merge(payload_log)
+        if LoggingContext.ERROR in payload_log:
+            return log, None
+
+        return log, IE(
+            path=ie_path,
+            source_identifier=identifier,
+            fetched_payload=all(
+                f["complete"] for f in record.files
+            ),  # returns True when record.files = []
         )
 
     def _get_records(
@@ -162,90 +289,81 @@ class OAIPMHPlugin(IEImportPlugin):
         collector: PayloadCollector,
         metadata_prefix: str,
         identifiers: list[str],
+        get_clients: Optional[
+            Callable[[], tuple[RepositoryInterface, PayloadCollector]]
+        ] = None,
+        limiter: Optional[RateLimiter] = None,
     ) -> None:
         """
         Downloads record metadata and payload for list of `identifiers`.
-        Works on `result`.
+        Works on `result`. If given, every request is subject to
+        `limiter`.
+
+        Up to `self._concurrency` records are processed concurrently if
+        `get_clients` is given. It is used to create the
+        repository-interface and payload-collector for every additional
+        worker (clients are not shared between threads). Workers only
+        return their results; the result, progress (based on the number
+        of completed records), and pushes are handled in this thread.
         """
 
-        for idx, identifier in enumerate(identifiers):
-            # collect record
-            context.set_progress(
-                f"fetching metadata of record '{identifier}' "
-                + f"({idx + 1}/{len(identifiers)})",
-            )
-            context.push()
-            log, record = self._retry(
-                interface.get_record,
-                kwargs={
-                    "metadata_prefix": metadata_prefix,
-                    "identifier": identifier,
-                },
-                description=f"fetching metadata of record {identifier}",
-                exceptions=requests.exceptions.ReadTimeout,
-            )
-            if LoggingContext.ERROR in log:
-                context.result.log.merge(log)
-                context.push()
-                continue
+        n = len(identifiers)
+        width = len(str(n))
+        workers = 1 if get_clients is None else min(self._concurrency, n)
+        lock = Lock()
+        push = ThrottledPush(context.push, self._PROGRESS_PUSH_INTERVAL)
+        local = thread_local()
+        spare_clients = [(interface, collector)]
+        clients = [(interface, collector)]
 
-            # process
-            context.set_progress(
-                f"processing metadata of record '{identifier}' "
-                + f"({idx + 1}/{len(identifiers)})"
-            )
-            context.push()
-            if record is None:
-                context.result.log.log(
-                    LoggingContext.ERROR, body=f"Got empty record '{identifier}'."
-                )
-                continue
-            if record.status == "deleted":
-                context.result.log.log(
-                    LoggingContext.WARNING,
-                    body=f"Record '{identifier}' has been marked 'deleted'.",
-                )
-                continue
-            ie_path = self._get_ie_output()
-            meta = ie_path / "meta"
-            meta.mkdir()
-            (meta / "source_metadata.xml").write_text(
-                record.metadata_raw, encoding="utf-8"
-            )
-            payload = ie_path / "data" / "preservation_master"
-            payload.mkdir(parents=True)
+        def process(
+            identifier: str,
+        ) -> tuple[Logger, Optional[IE], list[tuple[LoggingContext, str]]]:
+            if not hasattr(local, "clients"):
+                with lock:
+                    if spare_clients:
+                        local.clients = spare_clients.pop()
+                    else:
+                        local.clients = get_clients()
+                        clients.append(local.clients)
 
-            # fetching payload
-            context.set_progress(
-                f"fetching payload of record '{identifier}' "
-                + f"({idx + 1}/{len(identifiers)})"
-            )
-            context.push()
-            log, _ = self._retry(
-                collector.download_record_payload,
-                args=(record, payload),
-                description=f"fetching payload of record {identifier}",
-                exceptions=requests.exceptions.ReadTimeout,
+            # messages for the result's log are passed on to the
+            # consumer (keeps their order and origin)
+            messages = []
+            log, ie = self._get_record(
+                *local.clients,
+                metadata_prefix,
+                identifier,
+                lambda log_context, body: messages.append((log_context, body)),
+                limiter,
             )
-            if LoggingContext.ERROR in log:
+            return log, ie, messages
+
+        executor = (
+            ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+        )
+        context.set_progress(f"fetching records (0/{n})")
+        push()
+        try:
+            # results are yielded in order of `identifiers`
+            for idx, (log, ie, messages) in enumerate(
+                (executor.map if executor else map)(process, identifiers)
+            ):
                 context.result.log.merge(log)
-                context.push()
-                continue
-
-            context.result.ies[
-                "ie" + str(idx).zfill(len(str(len(identifiers))))
-            ] = IE(
-                path=ie_path,
-                source_identifier=identifier,
-                fetched_payload=all(
-                    f["complete"] for f in record.files
-                ),  # returns True when record.files = []
-            )
-            context.push()
+                for log_context, body in messages:
+                    context.result.log.log(log_context, body=body)
+                if ie is not None:
+                    context.result.ies[f"ie{idx:0{width}d}"] = ie
+                context.set_progress(f"fetching records ({idx + 1}/{n})")
+                push(force=idx == n - 1)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
         context.result.log.merge(
             Logger.octopus(
-                interface.log, collector.log, default_origin=self._NAME
+                *(client.log for pair in clients for client in pair),
+                default_origin=self._NAME,
             )
         )
         context.push()
@@ -256,10 +374,8 @@ class OAIPMHPlugin(IEImportPlugin):
         )
         context.push()
 
-        # initialize from request-args
-        interface = RepositoryInterface(kwargs["base_url"], self._timeout)
-        interface.preserve_log = True
-        collector = self._get_collector(kwargs["transfer_url_info"])
+        # clients are only initialized when needed
+        interface = None
 
         # fetch identifiers
         if "identifiers" in kwargs:
@@ -273,6 +389,7 @@ class OAIPMHPlugin(IEImportPlugin):
             )
             context.push()
             # get identifiers via interface
+            interface = self._get_interface(kwargs["base_url"])
             request_args = {  # build request body
                 "metadata_prefix": kwargs["metadata_prefix"],
                 "_max_resumption_tokens": self._max_resumption_tokens
@@ -331,10 +448,19 @@ class OAIPMHPlugin(IEImportPlugin):
             # download records
             self._get_records(
                 context,
-                interface,
-                collector,
+                (
+                    interface
+                    if interface is not None
+                    else self._get_interface(kwargs["base_url"])
+                ),
+                self._get_collector(kwargs["transfer_url_info"]),
                 kwargs["metadata_prefix"],
                 identifiers,
+                lambda: (
+                    self._get_interface(kwargs["base_url"]),
+                    self._get_collector(kwargs["transfer_url_info"]),
+                ),
+                self._get_limiter(kwargs["base_url"]),
             )
 
         context.result.success = all(
@@ -452,5 +578,7 @@ class OAIPMHPlugin2(OAIPMHPlugin):
             interface.list_identifiers_exhaustive_multiple_sets,
             kwargs=request_args,
             description="collecting identifiers",
-            exceptions=(requests.exceptions.ReadTimeout, OverflowError),
+            exceptions=self._TRANSIENT_EXCEPTIONS,
+            fatal_exceptions=(OverflowError,),
+            retry_if=self._is_transient,
         )
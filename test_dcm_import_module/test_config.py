@@ -0,0 +1,168 @@
+"""
+Test module for the app-config.
+"""
+
+import os
+import json
+from unittest import mock
+
+import pytest
+
+from dcm_import_module import config
+
+
+@pytest.fixture(name="api_document")
+def _api_document(tmp_path):
+    path = tmp_path / "openapi.yaml"
+    path.write_text("info:\n  version: 1.0.0\n", encoding="utf-8")
+    return path
+
+
+# bypass the `functools.cache`-decorator
+load_api_document = config._load_api_document.__wrapped__
+
+
+def test_load_api_document_cache_miss(tmp_path, api_document):
+    """Test function `_load_api_document` without existing cache."""
+
+    cache_dir = tmp_path / "cache"
+    doc = load_api_document(api_document, cache_dir)
+
+    assert doc == {"info": {"version": "1.0.0"}}
+    cache_path = config._api_document_cache_path(api_document, cache_dir)
+    assert cache_path.is_file()
+    assert json.loads(cache_path.read_bytes()) == {
+        "_mtime_ns": api_document.stat().st_mtime_ns,
+        "doc": doc,
+    }
+    # no temporary files left behind and source-directory untouched
+    assert list(cache_dir.iterdir()) == [cache_path]
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "cache", "openapi.yaml"
+    ]
+
+
+def test_load_api_document_cache_hit(tmp_path, api_document):
+    """Test function `_load_api_document` with valid cache."""
+
+    cache_dir = tmp_path / "cache"
+    load_api_document(api_document, cache_dir)
+
+    # manipulate cache to detect its use
+    cache_path = config._api_document_cache_path(api_document, cache_dir)
+    cached = json.loads(cache_path.read_bytes())
+    cached["doc"] = {"info": {"version": "cached"}}
+    cache_path.write_text(json.dumps(cached), encoding="utf-8")
+
+    assert load_api_document(api_document, cache_dir) == {
+        "info": {"version": "cached"}
+    }
+
+
+def test_load_api_document_cache_invalidation(tmp_path, api_document):
+    """
+    Test function `_load_api_document` with cache for outdated document.
+    """
+
+    cache_dir = tmp_path / "cache"
+    load_api_document(api_document, cache_dir)
+
+    api_document.write_text("info:\n  version: 2.0.0\n", encoding="utf-8")
+    mtime_ns = api_document.stat().st_mtime_ns + 1_000_000_000
+    os.utime(api_document, ns=(mtime_ns, mtime_ns))
+
+    assert load_api_document(api_document, cache_dir) == {
+        "info": {"version": "2.0.0"}
+    }
+    cache_path = config._api_document_cache_path(api_document, cache_dir)
+    assert json.loads(cache_path.read_bytes())["_mtime_ns"] == mtime_ns
+
+
+def test_load_api_document_cache_untrusted(tmp_path, api_document):
+    """
+    Test function `_load_api_document` with a cache that is writable by
+    other users.
+    """
+
+    cache_dir = tmp_path / "cache"
+    load_api_document(api_document, cache_dir)
+
+    cache_path = config._api_document_cache_path(api_document, cache_dir)
+    cached = json.loads(cache_path.read_bytes())
+    cached["doc"] = {"info": {"version": "cached"}}
+    cache_path.write_text(json.dumps(cached), encoding="utf-8")
+    cache_path.chmod(0o666)
+
+    assert load_api_document(api_document, cache_dir) == {
+        "info": {"version": "1.0.0"}
+    }
+
+
+def test_load_api_document_cache_not_writable(tmp_path, api_document):
+    """
+    Test function `_load_api_document` with a cache-location that can
+    not be written to.
+    """
+
+    # cache-directory can not be created below a regular file
+    (tmp_path / "file").touch()
+    cache_dir = tmp_path / "file" / "cache"
+
+    with mock.patch(
+        "dcm_import_module.config.json.dumps", side_effect=json.dumps
+    ) as dumps:
+        assert load_api_document(api_document, cache_dir) == {
+            "info": {"version": "1.0.0"}
+        }
+    dumps.assert_not_called()
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "file", "openapi.yaml"
+    ]
+
+
+def test_load_api_document_no_cache(tmp_path, api_document):
+    """Test function `_load_api_document` without cache-directory."""
+
+    assert load_api_document(api_document) == {
+        "info": {"version": "1.0.0"}
+    }
+    assert list(tmp_path.iterdir()) == [api_document]
+
+
+def test_identity_retry_settings(testing_config):
+    """Test self-description for retry-settings of the app-config."""
+
+    class ThisConfig(testing_config):
+        SOURCE_SYSTEM_TIMEOUT_RETRIES = 5
+        SOURCE_SYSTEM_RETRY_BASE_DELAY = 2
+        SOURCE_SYSTEM_RETRY_MAX_DELAY = 60
+        SOURCE_SYSTEM_RETRY_JITTER = 0.1
+
+    timeout = ThisConfig().CONTAINER_SELF_DESCRIPTION["configuration"][
+        "settings"
+    ]["import"]["timeout"]
+
+    assert timeout["max_retries"] == 5
+    assert timeout["retry_base_delay"] == 2
+    assert timeout["retry_max_delay"] == 60
+    assert timeout["retry_jitter"] == 0.1
+    # deprecated alias
+    assert timeout["retry_interval"] == 2
+
+
+def test_identity_request_settings(testing_config):
+    """
+    Test self-description for concurrency and rate-limit of requests to
+    source systems.
+    """
+
+    class ThisConfig(testing_config):
+        SOURCE_SYSTEM_CONCURRENCY = 4
+        SOURCE_SYSTEM_REQUEST_INTERVAL = 0.5
+
+    settings = ThisConfig().CONTAINER_SELF_DESCRIPTION["configuration"][
+        "settings"
+    ]["import"]
+
+    assert settings["concurrency"] == 4
+    assert settings["request_interval"] == 0.5
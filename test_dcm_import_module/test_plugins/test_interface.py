@@ -3,6 +3,8 @@ Test suite for the 'DCM Import Module' plugin-system interface.
 """
 
 from pathlib import Path
+from time import monotonic
+from unittest import mock
 
 import pytest
 from dcm_common import LoggingContext as Context
@@ -14,6 +16,7 @@ from dcm_import_module.plugins import (
     IEImportResult,
     IEImportPlugin,
 )
+from dcm_import_module.plugins.interface import ThrottledPush, RateLimiter
 
 
 @pytest.fixture(scope="module", name="test_plugin")
@@ -70,7 +73,9 @@ def create_test_plugin(file_storage):
             )
             return context.result
 
-    return TestPlugin(working_dir=file_storage, max_retries=1)
+    return TestPlugin(
+        working_dir=file_storage, max_retries=1, retry_base_delay=0
+    )
 
 
 def test_get_minimal(test_plugin):
@@ -96,3 +101,241 @@ def test_retry(test_plugin):
     assert len(result.ies) == 2
     assert Context.ERROR in result.log
     assert len(result.log[Context.ERROR]) == 2
+
+
+def test_retry_fatal(test_plugin):
+    """
+    Test method `_retry` of an implementation of the interface for
+    exceptions that should not be retried.
+    """
+
+    calls = []
+
+    def cmd():
+        calls.append(None)
+        raise ValueError("Failed.")
+
+    log, result = test_plugin._retry(
+        cmd, exceptions=TimeoutError, fatal_exceptions=ValueError
+    )
+
+    assert result is None
+    assert len(calls) == 1
+    assert len(log[Context.ERROR]) == 1
+    assert log[Context.ERROR][0].body.endswith(
+        "(Attempt 1/2) Not retrying."
+    )
+
+
+def test_retry_retry_if(test_plugin):
+    """
+    Test method `_retry` of an implementation of the interface for
+    exceptions that are rejected by the `retry_if`-predicate.
+    """
+
+    calls = []
+
+    def cmd(fatal):
+        calls.append(fatal)
+        raise ValueError(fatal)
+
+    for fatal, expected_calls in ((True, 1), (False, 2)):
+        calls.clear()
+        log, result = test_plugin._retry(
+            cmd,
+            args=(fatal,),
+            exceptions=ValueError,
+            retry_if=lambda exc_info: not exc_info.args[0],
+        )
+        assert result is None
+        assert len(calls) == expected_calls
+        assert len(log[Context.ERROR]) == expected_calls
+        assert log[Context.ERROR][-1].body.endswith(
+            "Not retrying." if fatal else "(Attempt 2/2)"
+        )
+
+
+def test_retry_backoff(test_plugin, file_storage):
+    """
+    Test method `_retry` of an implementation of the interface for
+    delays between attempts.
+    """
+
+    plugin = type(test_plugin)(
+        working_dir=file_storage,
+        max_retries=3,
+        retry_base_delay=1,
+        retry_max_delay=30,
+        retry_jitter=0,
+    )
+
+    def cmd():
+        raise TimeoutError()
+
+    with mock.patch("dcm_import_module.plugins.interface.sleep") as sleep:
+        log, result = plugin._retry(cmd)
+
+    assert result is None
+    assert len(log[Context.ERROR]) == 4
+    # no sleep after the final attempt
+    assert [call.args[0] for call in sleep.call_args_list] == [1, 2, 4]
+
+
+def test_retry_no_backoff_after_success(test_plugin, file_storage):
+    """
+    Test method `_retry` of an implementation of the interface for
+    not sleeping after a successful attempt.
+    """
+
+    plugin = type(test_plugin)(working_dir=file_storage, max_retries=3)
+    calls = []
+
+    def cmd():
+        calls.append(None)
+        if len(calls) < 2:
+            raise TimeoutError()
+        return "ok"
+
+    with mock.patch("dcm_import_module.plugins.interface.sleep") as sleep:
+        log, result = plugin._retry(cmd)
+
+    assert result == "ok"
+    assert sleep.call_count == 1
+    # earlier failed attempt is only a warning
+    assert Context.ERROR not in log
+    assert len(log[Context.WARNING]) == 1
+
+
+def test_retry_fatal_no_backoff(test_plugin, file_storage):
+    """
+    Test method `_retry` of an implementation of the interface for not
+    sleeping after exceptions that should not be retried.
+    """
+
+    plugin = type(test_plugin)(working_dir=file_storage, max_retries=3)
+
+    def cmd():
+        raise ValueError("Failed.")
+
+    with mock.patch("dcm_import_module.plugins.interface.sleep") as sleep:
+        plugin._retry(
+            cmd, exceptions=TimeoutError, fatal_exceptions=ValueError
+        )
+
+    sleep.assert_not_called()
+
+
+def test_get_retry_delay_max_delay(test_plugin, file_storage):
+    """
+    Test method `_get_retry_delay` of an implementation of the interface
+    for delays being capped by `retry_max_delay`.
+    """
+
+    plugin = type(test_plugin)(
+        working_dir=file_storage,
+        retry_base_delay=1,
+        retry_max_delay=5,
+        retry_jitter=0,
+    )
+
+    assert [plugin._get_retry_delay(retry) for retry in range(5)] == [
+        1, 2, 4, 5, 5
+    ]
+    # large exponents do not overflow
+    assert plugin._get_retry_delay(10_000) == 5
+
+
+def test_get_retry_delay_jitter(test_plugin, file_storage):
+    """
+    Test method `_get_retry_delay` of an implementation of the interface
+    for bounds of the jitter.
+    """
+
+    plugin = type(test_plugin)(
+        working_dir=file_storage,
+        retry_base_delay=1,
+        retry_max_delay=4,
+        retry_jitter=0.5,
+    )
+
+    # extremes of the jitter
+    for jitter, expected in ((-0.5, [0.5, 1, 2, 4]), (0.5, [1.5, 3, 4, 4])):
+        with mock.patch(
+            "dcm_import_module.plugins.interface.uniform",
+            return_value=jitter,
+        ):
+            assert [
+                plugin._get_retry_delay(retry) for retry in range(4)
+            ] == expected
+
+    # random jitter (capped by `retry_max_delay`)
+    for retry in range(4):
+        delay = 2**retry
+        for _ in range(100):
+            assert (
+                min(4, 0.5 * delay)
+                <= plugin._get_retry_delay(retry)
+                <= min(4, 1.5 * delay)
+            )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"retry_base_delay": -1},
+        {"retry_max_delay": -1},
+        {"retry_jitter": -0.1},
+        {"retry_jitter": 1.1},
+    ],
+    ids=["base_delay", "max_delay", "jitter_negative", "jitter_too_large"],
+)
+def test_retry_configuration_validation(test_plugin, file_storage, kwargs):
+    """
+    Test constructor of an implementation of the interface for bad
+    retry-configurations.
+    """
+
+    with pytest.raises(ValueError):
+        type(test_plugin)(working_dir=file_storage, **kwargs)
+
+
+def test_throttled_push():
+    """Test class `ThrottledPush`."""
+
+    calls = []
+    push = ThrottledPush(lambda: calls.append(None), 3600)
+
+    assert push()
+    assert not push()
+    assert len(calls) == 1
+    assert push(force=True)
+    assert len(calls) == 2
+
+    push = ThrottledPush(lambda: calls.append(None), 0)
+    assert push()
+    assert push()
+    assert len(calls) == 4
+
+
+def test_rate_limiter():
+    """Test class `RateLimiter`."""
+
+    calls = []
+    limited = RateLimiter(0.05).limit(lambda x: calls.append(x))
+
+    t0 = monotonic()
+    for i in range(3):
+        limited(i)
+
+    assert monotonic() - t0 >= 0.1
+    assert calls == [0, 1, 2]
+
+
+def test_rate_limiter_shared():
+    """Test method `RateLimiter.shared`."""
+
+    limiter = RateLimiter.shared("a", 0.05)
+
+    assert RateLimiter.shared("a", 0.05) is limiter
+    assert RateLimiter.shared("b", 0.05) is not limiter
+    assert RateLimiter.shared("a", 0.1) is not limiter
@@ -5,8 +5,10 @@ Test suite for the OAI-PMH-plugin.
 import os
 from unittest import mock
 from time import sleep
+from threading import Lock, get_ident
 
 import pytest
+import requests
 from oai_pmh_extractor.oaipmh_record import OAIPMHRecord
 from dcm_common import LoggingContext as Context, Logger
 
@@ -282,7 +284,10 @@ def test_timeout_retry(file_storage, run_service):
     )
 
     plugin = OAIPMHPlugin(
-        file_storage, timeout=timeout_duration, max_retries=max_retries
+        file_storage,
+        timeout=timeout_duration,
+        max_retries=max_retries,
+        retry_base_delay=0,
     )
 
     result = plugin.get(
@@ -296,3 +301,315 @@ def test_timeout_retry(file_storage, run_service):
 
     assert Context.ERROR in result.log
     assert len(result.log[Context.ERROR]) == 4
+
+
+@pytest.mark.parametrize(
+    "concurrency",
+    [1, 2, 5],
+    ids=["sequential", "concurrent", "more-workers-than-records"]
+)
+def test_get_concurrency(
+    file_storage, oai_url, get_record_patcher,
+    download_record_payload_patcher, concurrency
+):
+    """
+    Test method `get` of `OAIPMH`-plugin with concurrent processing of
+    records.
+    """
+
+    get_record_patcher.start()
+    download_record_payload_patcher.start()
+
+    identifiers = ["oai:0", "oai:1", "oai:2", "oai:3"]
+    result = OAIPMHPlugin(file_storage, concurrency=concurrency).get(
+        None,
+        transfer_url_info={"regex": f"({_oai_url()}.*)"},
+        base_url=oai_url,
+        metadata_prefix="",
+        identifiers=identifiers,
+    )
+
+    assert result.success
+    assert list(result.ies) == ["ie0", "ie1", "ie2", "ie3"]
+    assert [
+        ie.source_identifier for ie in result.ies.values()
+    ] == identifiers
+
+    get_record_patcher.stop()
+    download_record_payload_patcher.stop()
+
+
+def test_get_concurrency_clients(file_storage, oai_url, oai_identifier):
+    """
+    Test method `get` of `OAIPMH`-plugin for not sharing clients
+    between threads during concurrent processing of records.
+    """
+
+    lock = Lock()
+    interfaces = {}
+    collectors = {}
+
+    def fake_get_record(self, *args, **kwargs):
+        with lock:
+            interfaces.setdefault(id(self), set()).add(get_ident())
+        sleep(0.01)  # make workers overlap
+        return OAIPMHRecord(oai_identifier, metadata_raw="<OAI-PMH/>")
+
+    def fake_download_record_payload(self, *args, **kwargs):
+        with lock:
+            collectors.setdefault(id(self), set()).add(get_ident())
+
+    with mock.patch(
+        "oai_pmh_extractor.repository_interface.RepositoryInterface.get_record",
+        fake_get_record
+    ), mock.patch(
+        "oai_pmh_extractor.payload_collector.PayloadCollector.download_record_payload",
+        fake_download_record_payload
+    ):
+        result = OAIPMHPlugin(file_storage, concurrency=3).get(
+            None,
+            transfer_url_info={"regex": f"({_oai_url()}.*)"},
+            base_url=oai_url,
+            metadata_prefix="",
+            identifiers=[f"oai:{i}" for i in range(9)],
+        )
+
+    assert len(result.ies) == 9
+    assert 1 < len(interfaces) <= 3
+    assert 1 < len(collectors) <= 3
+    # every client is only used by a single thread
+    assert all(len(threads) == 1 for threads in interfaces.values())
+    assert all(len(threads) == 1 for threads in collectors.values())
+
+
+class _FakeContext:
+    """Minimal execution-context that records progress and pushes."""
+
+    def __init__(self):
+        self.result = IEImportResult(log=Logger(default_origin="result"))
+        self.progress = []
+        self.pushes = []
+        self.threads = set()
+
+    def set_progress(self, progress):
+        self.progress.append(progress)
+        self.threads.add(get_ident())
+
+    def push(self):
+        self.pushes.append(len(self.result.ies))
+        self.threads.add(get_ident())
+
+
+def test_get_records_final_push(
+    file_storage, oai_url, get_record_patcher,
+    download_record_payload_patcher
+):
+    """
+    Test method `_get_records` of `OAIPMH`-plugin for a final forced
+    push with throttled pushes and rate-limited requests.
+    """
+
+    get_record_patcher.start()
+    download_record_payload_patcher.start()
+
+    plugin = OAIPMHPlugin(file_storage, concurrency=2, request_interval=0.01)
+    transfer_url_info = {"regex": f"({_oai_url()}.*)"}
+    context = _FakeContext()
+    with mock.patch.object(OAIPMHPlugin, "_PROGRESS_PUSH_INTERVAL", 3600):
+        plugin._get_records(
+            context,
+            plugin._get_interface(oai_url),
+            plugin._get_collector(transfer_url_info),
+            "",
+            ["oai:0", "oai:1", "oai:2", "oai:3"],
+            lambda: (
+                plugin._get_interface(oai_url),
+                plugin._get_collector(transfer_url_info),
+            ),
+            plugin._get_limiter(oai_url),
+        )
+
+    assert len(context.result.ies) == 4
+    # first (progress-)push, forced push after the last record, and
+    # push after merging client-logs
+    assert context.pushes == [0, 4, 4]
+
+    get_record_patcher.stop()
+    download_record_payload_patcher.stop()
+
+
+def test_get_records_deleted_record_origin(
+    file_storage, oai_url, get_deleted_record_patcher
+):
+    """
+    Test method `_get_records` of `OAIPMH`-plugin for logging deleted
+    records with the origin of the result's log.
+    """
+
+    get_deleted_record_patcher.start()
+
+    plugin = OAIPMHPlugin(file_storage, concurrency=2)
+    context = _FakeContext()
+    plugin._get_records(
+        context,
+        plugin._get_interface(oai_url),
+        plugin._get_collector({"regex": ""}),
+        "",
+        ["oai:0", "oai:1"],
+    )
+
+    assert context.result.ies == {}
+    assert len(context.result.log[Context.WARNING]) == 2
+    assert all(
+        msg.origin == "result" for msg in context.result.log[Context.WARNING]
+    )
+
+    get_deleted_record_patcher.stop()
+
+
+@pytest.mark.parametrize(
+    ("status_code", "retried"),
+    [(404, False), (400, False), (429, True), (500, True), (503, True)],
+    ids=["404", "400", "429", "500", "503"],
+)
+def test_get_http_error(file_storage, oai_url, status_code, retried):
+    """
+    Test method `get` of `OAIPMH`-plugin for retrying only transient
+    HTTP errors.
+    """
+
+    calls = []
+
+    def fake_get_record(*args, **kwargs):
+        calls.append(None)
+        response = requests.Response()
+        response.status_code = status_code
+        raise requests.exceptions.HTTPError(response=response)
+
+    with mock.patch(
+        "oai_pmh_extractor.repository_interface.RepositoryInterface.get_record",
+        fake_get_record
+    ):
+        result = OAIPMHPlugin(
+            file_storage, max_retries=2, retry_base_delay=0
+        ).get(
+            None,
+            transfer_url_info={"regex": ""},
+            base_url=oai_url,
+            metadata_prefix="",
+            identifiers=["oai:0"],
+        )
+
+    assert result.ies == {}
+    assert len(calls) == (3 if retried else 1)
+    assert (
+        "Not retrying." in result.log[Context.ERROR][-1].body
+    ) is not retried
+
+
+def test_get_retry_success(
+    file_storage, oai_url, oai_identifier, download_record_payload_patcher
+):
+    """
+    Test method `get` of `OAIPMH`-plugin for a record that is fetched
+    successfully after a failed attempt.
+    """
+
+    calls = []
+
+    def fake_get_record(*args, **kwargs):
+        calls.append(None)
+        if len(calls) == 1:
+            raise requests.exceptions.ReadTimeout()
+        return OAIPMHRecord(oai_identifier, metadata_raw="<OAI-PMH/>")
+
+    download_record_payload_patcher.start()
+    with mock.patch(
+        "oai_pmh_extractor.repository_interface.RepositoryInterface.get_record",
+        fake_get_record
+    ):
+        result = OAIPMHPlugin(
+            file_storage, max_retries=1, retry_base_delay=0
+        ).get(
+            None,
+            transfer_url_info={"regex": ""},
+            base_url=oai_url,
+            metadata_prefix="",
+            identifiers=["oai:0"],
+        )
+    download_record_payload_patcher.stop()
+
+    assert len(calls) == 2
+    assert result.success
+    assert list(result.ies) == ["ie0"]
+    assert Context.ERROR not in result.log
+    assert any(
+        "ReadTimeout" in msg.body for msg in result.log[Context.WARNING]
+    )
+
+
+def test_get_records_progress(file_storage, oai_url, oai_identifier):
+    """
+    Test method `_get_records` of `OAIPMH`-plugin for monotonic progress
+    and pushes from the calling thread during concurrent processing.
+    """
+
+    def fake_get_record(*args, identifier, **kwargs):
+        # later records finish first
+        sleep(0.01 * (5 - int(identifier.split(":")[1])))
+        return OAIPMHRecord(oai_identifier, metadata_raw="<OAI-PMH/>")
+
+    plugin = OAIPMHPlugin(file_storage, concurrency=3)
+    transfer_url_info = {"regex": ""}
+    context = _FakeContext()
+    with mock.patch(
+        "oai_pmh_extractor.repository_interface.RepositoryInterface.get_record",
+        fake_get_record
+    ), mock.patch(
+        "oai_pmh_extractor.payload_collector.PayloadCollector.download_record_payload",
+        lambda *args, **kwargs: None
+    ), mock.patch.object(OAIPMHPlugin, "_PROGRESS_PUSH_INTERVAL", 0):
+        plugin._get_records(
+            context,
+            plugin._get_interface(oai_url),
+            plugin._get_collector(transfer_url_info),
+            "",
+            [f"oai:{i}" for i in range(5)],
+            lambda: (
+                plugin._get_interface(oai_url),
+                plugin._get_collector(transfer_url_info),
+            ),
+        )
+
+    assert len(context.result.ies) == 5
+    assert context.threads == {get_ident()}
+    assert context.progress == [
+        f"fetching records ({i}/5)" for i in range(6)
+    ]
+    assert context.pushes == sorted(context.pushes)
+
+
+def test_get_limiter(file_storage, oai_url):
+    """
+    Test method `_get_limiter` of `OAIPMH`-plugin for sharing rate
+    limiters per source system.
+    """
+
+    assert OAIPMHPlugin(file_storage)._get_limiter(oai_url) is None
+
+    limiter = OAIPMHPlugin(file_storage, request_interval=0.02)._get_limiter(
+        oai_url
+    )
+    assert limiter is not None
+    # shared between plugin instances (jobs)
+    assert (
+        OAIPMHPlugin(file_storage, request_interval=0.02)._get_limiter(oai_url)
+        is limiter
+    )
+    # not shared between source systems
+    assert (
+        OAIPMHPlugin(file_storage, request_interval=0.02)._get_limiter(
+            oai_url + "other"
+        )
+        is not limiter
+    )
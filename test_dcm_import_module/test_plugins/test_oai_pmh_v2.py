@@ -355,7 +355,10 @@ def test_timeout_retry(file_storage, run_service):
     )
 
     plugin = OAIPMHPlugin2(
-        file_storage, timeout=timeout_duration, max_retries=max_retries
+        file_storage,
+        timeout=timeout_duration,
+        max_retries=max_retries,
+        retry_base_delay=0,
     )
 
     result = plugin.get(
@@ -484,3 +487,39 @@ def test_get_max_resumption_tokens(
         )
 
     get_record_patcher.stop()
+
+
+@pytest.mark.parametrize(
+    "concurrency",
+    [1, 2, 5],
+    ids=["sequential", "concurrent", "more-workers-than-records"]
+)
+def test_get_concurrency(
+    file_storage, oai_url, get_record_patcher, download_file_patcher,
+    concurrency
+):
+    """
+    Test method `get` of `OAIPMH`-plugin with concurrent processing of
+    records.
+    """
+
+    get_record_patcher.start()
+    download_file_patcher.start()
+
+    identifiers = ["oai:0", "oai:1", "oai:2", "oai:3"]
+    result = OAIPMHPlugin2(file_storage, concurrency=concurrency).get(
+        None,
+        transfer_url_info=[{"regex": f"({_oai_url()}.*)"}],
+        base_url=oai_url,
+        metadata_prefix="",
+        identifiers=identifiers,
+    )
+
+    assert result.success
+    assert list(result.ies) == ["ie0", "ie1", "ie2", "ie3"]
+    assert [
+        ie.source_identifier for ie in result.ies.values()
+    ] == identifiers
+
+    get_record_patcher.stop()
+    download_file_patcher.stop()
@@ -152,7 +152,7 @@ def test_timeout_of_source_system(
     class ThisConfig(testing_config):
         SOURCE_SYSTEM_TIMEOUT = 0.1
         SOURCE_SYSTEM_TIMEOUT_RETRIES = 1
-        SOURCE_SYSTEM_TIMEOUT_RETRY_INTERVAL = 1
+        SOURCE_SYSTEM_RETRY_BASE_DELAY = 0
         SUPPORTED_PLUGINS = [plugin]
 
     app = app_factory(ThisConfig())